@@ -0,0 +1,164 @@
+# backend/admission.py
+# Per-route admission control: bounded concurrency + bounded wait queue.
+# Requests over the queue limit are shed immediately with 503 + Retry-After,
+# so heavy DB routes can't starve /health and /eye/assess.
+import os, time, asyncio, logging
+from fastapi import HTTPException
+
+logger = logging.getLogger("officeEz")
+
+# ---- Settings / Globals ----
+_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER", "2"))
+_QUEUE_TIMEOUT_SECONDS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "5"))
+_SHED_LOG_INTERVAL = float(os.getenv("ADMISSION_SHED_LOG_INTERVAL", "10"))
+_limiters = {}
+
+
+class RouteLimiter:
+    """
+    Caps in-flight requests for one route (or one shared budget). Up to
+    `max_queue` callers may wait for a slot; anyone beyond that is shed.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self._sem = None
+        self._loop = None
+        self._last_log = 0.0
+        self._unlogged = 0
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Created lazily and per event loop: a semaphore binds to the first loop
+        # that waits on it, and TestClient/Mangum may run us on a fresh loop.
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._loop is not loop:
+            self._sem = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+        return self._sem
+
+    async def acquire(self, timeout: float) -> str | None:
+        """
+        Takes a slot, waiting at most `timeout` seconds. Returns None on success,
+        otherwise the reason the request was shed. Counters are left to the caller.
+        """
+        # Decide synchronously, before the first await, so a burst arriving in
+        # one loop tick can't all slip into the queue.
+        if self.active + self.waiting >= self.max_concurrent + self.max_queue:
+            return "queue full"
+        if timeout <= 0:
+            return "queue timeout"
+
+        sem = self._semaphore()
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(sem.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return "queue timeout"
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        return None
+
+    def release(self):
+        self.active -= 1
+        # A semaphore from a previous loop has already been replaced; drop it.
+        if self._sem is not None and self._loop is asyncio.get_running_loop():
+            self._sem.release()
+
+    def log_shed(self, reason: str):
+        # At most one line per interval; the counters carry the full picture.
+        self._unlogged += 1
+        now = time.monotonic()
+        if now - self._last_log < _SHED_LOG_INTERVAL:
+            return
+        logger.warning("Admission shed %d request(s) on %s (last: %s): active=%d waiting=%d",
+                       self._unlogged, self.name, reason, self.active, self.waiting)
+        self._last_log = now
+        self._unlogged = 0
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+def _get_limiter(name: str, max_concurrent: int, max_queue: int) -> RouteLimiter:
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = _limiters[name] = RouteLimiter(name, max_concurrent, max_queue)
+    return limiter
+
+
+async def _admit_all(chain: list, queue_timeout: float) -> list:
+    """
+    Acquires every limiter in `chain` under one shared deadline. On success all
+    of them count the request as admitted; if any one sheds it, slots already
+    taken are returned and both the shedding limiter and the route (chain[0])
+    count a rejection.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + queue_timeout
+    held = []
+    for limiter in chain:
+        reason = await limiter.acquire(deadline - loop.time())
+        if reason is not None:
+            for h in reversed(held):
+                h.release()
+            for l in {chain[0], limiter}:
+                l.rejected += 1
+            limiter.log_shed(reason)
+            raise HTTPException(
+                status_code=503,
+                detail="Server busy, please retry shortly",
+                headers={"Retry-After": str(_RETRY_AFTER_SECONDS)},
+            )
+        held.append(limiter)
+
+    for limiter in held:
+        limiter.admitted += 1
+    return held
+
+
+# ---------- Public helpers ----------
+def limit(name: str, max_concurrent: int, max_queue: int, budget: tuple | None = None,
+          queue_timeout: float = _QUEUE_TIMEOUT_SECONDS):
+    """
+    Returns a FastAPI dependency that holds a slot of the named limiter for the
+    duration of the request. `budget=(name, max_concurrent, max_queue)` also draws
+    from a limiter shared by several routes. A request waits at most
+    `queue_timeout` in total across both. The dependency is async, so waiting and
+    shedding happen on the event loop before a threadpool worker or DB
+    connection is taken.
+    """
+    chain = [_get_limiter(name, max_concurrent, max_queue)]
+    if budget is not None:
+        chain.append(_get_limiter(*budget))
+
+    async def _admit():
+        held = await _admit_all(chain, queue_timeout)
+        try:
+            yield
+        finally:
+            for limiter in reversed(held):
+                limiter.release()
+
+    return _admit
+
+
+def admission_stats() -> dict:
+    """
+    Snapshot of queue depth, in-flight count and rejection count per limiter.
+    """
+    return {name: l.stats() for name, l in _limiters.items()}
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 from sqlalchemy import text, select, func
 from sqlalchemy.orm import Session
 from db import get_db
+from admission import limit as admission_limit, admission_stats
 import logging
 
 
@@ -53,6 +54,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Admission control: heavy = ORDER BY RAND() / full-table scans, light = small
+# reference tables. /health and /eye/assess are deliberately left unlimited.
+# Each route has its own limiter, and every route in a class also draws from a
+# shared class budget; waiting for both is bounded by one ADMISSION_QUEUE_TIMEOUT.
+# Budgets are sized so all DB-bound work together stays within the SQLAlchemy
+# pool (5 + 10 overflow) and leaves most of anyio's 40 threadpool tokens for the
+# cheap sync routes.
+# Only effective under uvicorn; on Lambda each environment serves one request.
+HEAVY_CONCURRENCY = int(os.getenv("ADMISSION_HEAVY_CONCURRENCY", "2"))
+HEAVY_QUEUE = int(os.getenv("ADMISSION_HEAVY_QUEUE", "4"))
+HEAVY_BUDGET = int(os.getenv("ADMISSION_HEAVY_BUDGET", "4"))
+HEAVY_BUDGET_QUEUE = int(os.getenv("ADMISSION_HEAVY_BUDGET_QUEUE", "8"))
+LIGHT_CONCURRENCY = int(os.getenv("ADMISSION_LIGHT_CONCURRENCY", "4"))
+LIGHT_QUEUE = int(os.getenv("ADMISSION_LIGHT_QUEUE", "8"))
+LIGHT_BUDGET = int(os.getenv("ADMISSION_LIGHT_BUDGET", "6"))
+LIGHT_BUDGET_QUEUE = int(os.getenv("ADMISSION_LIGHT_BUDGET_QUEUE", "12"))
+
+def heavy(name: str):
+    budget = ("heavy", HEAVY_BUDGET, HEAVY_BUDGET_QUEUE)
+    return [Depends(admission_limit(name, HEAVY_CONCURRENCY, HEAVY_QUEUE, budget=budget))]
+
+def light(name: str):
+    budget = ("light", LIGHT_BUDGET, LIGHT_BUDGET_QUEUE)
+    return [Depends(admission_limit(name, LIGHT_CONCURRENCY, LIGHT_QUEUE, budget=budget))]
+
 
 # Health & Utility Endpoints
 
@@ -64,17 +90,21 @@ def root():
 def health():
     return {"ok": True}
 
-@app.get("/health/db")
+@app.get("/health/admission")
+def health_admission():
+    return admission_stats()
+
+@app.get("/health/db", dependencies=light("/health/db"))
 def db_health(db: Session = Depends(get_db)):
     db.execute(text("SELECT 1"))
     return {"db": "ok"}
 
-@app.get("/tables")
+@app.get("/tables", dependencies=heavy("/tables"))
 def list_tables(db: Session = Depends(get_db)):
     rows = db.execute(text("SHOW TABLES")).fetchall()
     return {"tables": [r[0] for r in rows]}
 
-@app.get("/peek")
+@app.get("/peek", dependencies=heavy("/peek"))
 def peek_table(
     table: str = Query(..., pattern=r"^[A-Za-z0-9_]+$"),
     limit: int = 10,
@@ -89,7 +119,7 @@ def peek_table(
 # ------------- IT2: STRESS, STRETCH, WORKDAY, GUIDELINES ----
 
 
-@app.get("/stress/suggestion")
+@app.get("/stress/suggestion", dependencies=heavy("/stress/suggestion"))
 def stress_suggestion(db: Session = Depends(get_db)):
     row = db.execute(text("""
         SELECT id, site_name, suggestion_name, steps, site_link
@@ -100,7 +130,7 @@ def stress_suggestion(db: Session = Depends(get_db)):
         raise HTTPException(404, "No stress suggestions found")
     return dict(row)
 
-@app.get("/stretch/random-set")
+@app.get("/stretch/random-set", dependencies=heavy("/stretch/random-set"))
 def stretch_random_set(db: Session = Depends(get_db)):
     try:
         pick = db.execute(text("""
@@ -126,7 +156,7 @@ def stretch_random_set(db: Session = Depends(get_db)):
         logger.exception("Error in /stretch/random-set")
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
-@app.get("/guidelines")
+@app.get("/guidelines", dependencies=light("/guidelines"))
 def get_activity_guidelines(db: Session = Depends(get_db)):
     """
     Returns activity guideline percentages for each age group.
@@ -149,7 +179,7 @@ def get_activity_guidelines(db: Session = Depends(get_db)):
     return [dict(r) for r in rows]
 
 
-@app.get("/activity/guidelines")
+@app.get("/activity/guidelines", dependencies=light("/activity/guidelines"))
 def get_guidelines(db: Session = Depends(get_db)):
     rows = db.execute(text("""
         SELECT age_group, percent_mostly_sitting, percent_mostly_standing,
@@ -166,7 +196,7 @@ def get_guidelines(db: Session = Depends(get_db)):
 
 
 # Connection Score Table
-@app.get("/connection-scores")
+@app.get("/connection-scores", dependencies=heavy("/connection-scores"))
 def connection_scores(db: Session = Depends(get_db)):
     rows = db.execute(text("""
         SELECT id, question, answer_options
@@ -182,7 +212,7 @@ def connection_scores(db: Session = Depends(get_db)):
 
 
 #  Loneliness Trend
-@app.get("/loneliness-trend")
+@app.get("/loneliness-trend", dependencies=light("/loneliness-trend"))
 def loneliness_trend(db: Session = Depends(get_db)):
     rows = db.execute(text("""
         SELECT year, loneliness_percent
@@ -194,7 +224,7 @@ def loneliness_trend(db: Session = Depends(get_db)):
     return [dict(r) for r in rows]
 
 #  Score Calculation Table
-@app.get("/connection-bands")
+@app.get("/connection-bands", dependencies=light("/connection-bands"))
 def connection_bands(db: Session = Depends(get_db)):
     rows = db.execute(text("""
         SELECT id, total_score_range, connection_band
@@ -204,7 +234,7 @@ def connection_bands(db: Session = Depends(get_db)):
     return [dict(r) for r in rows]
 
 #  Social Connection Insights
-@app.get("/social-connection-insights")
+@app.get("/social-connection-insights", dependencies=heavy("/social-connection-insights"))
 def social_insights(db: Session = Depends(get_db)):
     rows = db.execute(text("""
         SELECT Source_Table, Metric, Sex, Age_group, Year, Value
@@ -216,7 +246,7 @@ def social_insights(db: Session = Depends(get_db)):
     return [dict(r) for r in rows]
 
 #  Volunteering Trend
-@app.get("/volunteering-trend")
+@app.get("/volunteering-trend", dependencies=light("/volunteering-trend"))
 def volunteering_trend(db: Session = Depends(get_db)):
     rows = db.execute(text("""
         SELECT year, voluntary_work_through_an_organisation, informal_volunteering
@@ -231,7 +261,7 @@ def volunteering_trend(db: Session = Depends(get_db)):
 
 
 
-@app.get("/social-contact-trend")
+@app.get("/social-contact-trend", dependencies=heavy("/social-contact-trend"))
 def social_contact_trend(db: Session = Depends(get_db)):
     """
     Returns yearly average social contact score for all age groups.
@@ -2,28 +2,34 @@
 import os, json
 import boto3
 import pymysql
-from sqlalchemy import create_engine
+from botocore.config import Config
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
 # ---- Settings / Globals ----
 _AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
+_WARM_CONNECT_TIMEOUT = int(os.getenv("DB_WARM_CONNECT_TIMEOUT", "2"))
+# Bounded Secrets Manager client for the warm-up path only (boto3 defaults: 60 s + retries)
+_WARM_SECRETS_CONFIG = Config(connect_timeout=_WARM_CONNECT_TIMEOUT, read_timeout=_WARM_CONNECT_TIMEOUT,
+                              retries={"max_attempts": 1})
+_engine = None
 _session_factory = None
 _connection = None  # for raw pymysql reuse across Lambda invocations
 
 
 # ---------- Secrets Manager (preferred) ----------
-def _get_secret_dict(arn: str) -> dict:
-    sm = boto3.client("secretsmanager", region_name=_AWS_REGION)
+def _get_secret_dict(arn: str, config: Config | None = None) -> dict:
+    sm = boto3.client("secretsmanager", region_name=_AWS_REGION, config=config)
     s = sm.get_secret_value(SecretId=arn)
     return json.loads(s.get("SecretString") or "{}")
 
 
-def _make_sqlalchemy_engine_from_secret():
+def _make_sqlalchemy_engine_from_secret(secrets_config: Config | None = None):
     arn = os.getenv("DB_SECRET_ARN")
     dbname = os.getenv("DB_NAME")
     if not arn or not dbname:
         raise RuntimeError("DB_SECRET_ARN and DB_NAME must be set (or use DB_URL)")
-    sec = _get_secret_dict(arn)
+    sec = _get_secret_dict(arn, secrets_config)
     user = sec["username"]
     pwd  = sec["password"]
     host = sec["host"]
@@ -73,21 +79,22 @@ def _make_pymysql_conn_from_url():
 
 
 # ---------- Public helpers ----------
-def get_session_factory():
+def get_session_factory(secrets_config: Config | None = None):
     """
     Returns a SQLAlchemy session factory. Uses Secret if available, otherwise DB_URL.
+    `secrets_config` overrides the boto3 client config for the secret fetch.
     """
-    global _session_factory
+    global _engine, _session_factory
     if _session_factory is not None:
         return _session_factory
 
     try:
-        engine = _make_sqlalchemy_engine_from_secret()
+        _engine = _make_sqlalchemy_engine_from_secret(secrets_config)
     except Exception:
         # fallback to DB_URL for local/dev
-        engine = _make_sqlalchemy_engine_from_url()
+        _engine = _make_sqlalchemy_engine_from_url()
 
-    _session_factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    _session_factory = sessionmaker(bind=_engine, autoflush=False, autocommit=False)
     return _session_factory
 
 
@@ -116,3 +123,31 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def warm_up():
+    """
+    Builds the engine/session factory (incl. Secrets Manager fetch) and checks a
+    connection in and out so the pool holds one open connection for the next request.
+    Both the secret fetch and the DB connect use short timeouts so an unreachable
+    endpoint can't eat the Lambda init window; request-time connects are unaffected.
+    """
+    get_session_factory(_WARM_SECRETS_CONFIG)
+
+    def _short_timeout(dialect, conn_rec, cargs, cparams):
+        # cparams is shared engine-wide: connect from a copy, never mutate it
+        return dialect.connect(*cargs, **{**cparams, "connect_timeout": _WARM_CONNECT_TIMEOUT})
+
+    event.listen(_engine, "do_connect", _short_timeout)
+    try:
+        with _engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    finally:
+        event.remove(_engine, "do_connect", _short_timeout)
+
+def dispose_engine():
+    """
+    Closes pooled connections (e.g. before a Lambda snapshot); the engine reconnects on demand.
+    """
+    if _engine is not None:
+        _engine.dispose()
@@ -0,0 +1,4 @@
+# Backend modules import each other flat (e.g. `from db import get_db`).
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,131 @@
+import asyncio, threading
+from fastapi import FastAPI, Depends, HTTPException
+from fastapi.testclient import TestClient
+from admission import RouteLimiter, limit, admission_stats
+
+
+async def _hold(dep, gate):
+    agen = dep()
+    await agen.__anext__()
+    try:
+        await gate.wait()
+    finally:
+        await agen.aclose()
+
+
+def test_burst_is_shed_beyond_concurrency_plus_queue(caplog):
+    dep = limit("t-burst", 2, 4)
+
+    async def run():
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(dep, gate)) for _ in range(50)]
+        await asyncio.sleep(0)
+        stats = admission_stats()["t-burst"]
+        assert stats["active"] + stats["queue_depth"] == 6
+        gate.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(run())
+    errors = [r for r in results if isinstance(r, HTTPException)]
+    assert len(errors) == 44
+    assert all(e.status_code == 503 and "Retry-After" in e.headers for e in errors)
+    stats = admission_stats()["t-burst"]
+    assert stats["rejected"] == 44 and stats["admitted"] == 6
+    assert stats["active"] == 0 and stats["queue_depth"] == 0
+    assert len([r for r in caplog.records if "t-burst" in r.getMessage()]) == 1
+
+
+def test_queue_timeout_rejects():
+    limiter = RouteLimiter("t-slow", max_concurrent=1, max_queue=1)
+
+    async def run():
+        assert await limiter.acquire(0.01) is None
+        assert await limiter.acquire(0.01) == "queue timeout"
+        limiter.release()
+
+    asyncio.run(run())
+    assert limiter.waiting == 0 and limiter.active == 0
+
+
+def test_shared_deadline_covers_route_and_budget():
+    # Route slot is free, budget is saturated: the whole wait must respect one timeout.
+    hog = limit("t-hog", 1, 0, budget=("t-deadline-budget", 1, 1))
+    dep = limit("t-deadline", 1, 1, budget=("t-deadline-budget", 1, 1), queue_timeout=0.05)
+
+    async def run():
+        gate = asyncio.Event()
+        holder = asyncio.create_task(_hold(hog, gate))
+        await asyncio.sleep(0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            await _hold(dep, gate)
+        except HTTPException:
+            pass
+        elapsed = loop.time() - start
+        gate.set()
+        await holder
+        return elapsed
+
+    assert asyncio.run(run()) < 0.5
+    stats = admission_stats()
+    assert stats["t-deadline"]["rejected"] == 1 and stats["t-deadline"]["admitted"] == 0
+    assert stats["t-deadline"]["active"] == 0
+
+
+def test_limiter_survives_a_new_event_loop():
+    dep = limit("t-loops", 1, 1)
+
+    async def contend():
+        gate = asyncio.Event()
+        tasks = [asyncio.create_task(_hold(dep, gate)) for _ in range(2)]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(contend())
+    asyncio.run(contend())
+    stats = admission_stats()["t-loops"]
+    assert stats["admitted"] == 4 and stats["rejected"] == 0
+
+
+def test_app_sheds_across_routes_sharing_a_budget():
+    entered, release = threading.Event(), threading.Event()
+    budget = ("t-app-budget", 1, 0)
+    app = FastAPI()
+
+    @app.get("/a", dependencies=[Depends(limit("t-app-a", 1, 0, budget=budget))])
+    def route_a():
+        entered.set()
+        release.wait(5)
+        return {"ok": True}
+
+    @app.get("/b", dependencies=[Depends(limit("t-app-b", 1, 0, budget=budget))])
+    def route_b():
+        return {"ok": True}
+
+    @app.get("/health/admission")
+    def health_admission():
+        return admission_stats()
+
+    with TestClient(app) as client:
+        slow = threading.Thread(target=client.get, args=("/a",))
+        slow.start()
+        assert entered.wait(5)
+
+        resp = client.get("/b")
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"]
+
+        stats = client.get("/health/admission").json()
+        assert stats["t-app-b"]["rejected"] == 1 and stats["t-app-b"]["admitted"] == 0
+        assert stats["t-app-budget"]["rejected"] == 1 and stats["t-app-budget"]["active"] == 1
+        assert stats["t-app-b"]["active"] == 0
+
+        release.set()
+        slow.join(5)
+        assert client.get("/b").status_code == 200
+
+    stats = admission_stats()
+    assert stats["t-app-budget"]["active"] == 0
+    assert stats["t-app-a"]["admitted"] == 1 and stats["t-app-b"]["admitted"] == 1
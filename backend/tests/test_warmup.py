@@ -0,0 +1,109 @@
+import sys, types, importlib
+import pytest
+import db
+
+
+class _Refused(Exception):
+    pass
+
+
+@pytest.fixture
+def fresh_db(monkeypatch):
+    monkeypatch.setattr(db, "_engine", None)
+    monkeypatch.setattr(db, "_session_factory", None)
+    monkeypatch.setenv("DB_URL", "mysql+pymysql://u:p@db.invalid:3306/x")
+    monkeypatch.delenv("DB_SECRET_ARN", raising=False)
+    yield
+    if db._engine is not None:
+        db._engine.dispose()
+
+
+def test_warm_up_timeout_does_not_leak_into_later_connects(fresh_db, monkeypatch):
+    db.get_session_factory()
+    calls = []
+
+    def fake_connect(*cargs, **cparams):
+        calls.append(cparams)
+        raise _Refused()
+
+    monkeypatch.setattr(db._engine.dialect, "connect", fake_connect)
+
+    with pytest.raises(Exception):
+        db.warm_up()
+    with pytest.raises(Exception):
+        db._engine.connect()
+
+    assert calls[0]["connect_timeout"] == db._WARM_CONNECT_TIMEOUT
+    assert "connect_timeout" not in calls[1]
+
+
+def test_warm_up_bounds_secrets_manager_fetch(fresh_db, monkeypatch):
+    monkeypatch.setenv("DB_SECRET_ARN", "arn:aws:secretsmanager:us-east-1:0:secret:x")
+    monkeypatch.setenv("DB_NAME", "x")
+    configs = []
+
+    def fake_client(service, region_name=None, config=None):
+        configs.append(config)
+        raise _Refused()
+
+    def no_db_url():
+        raise _Refused()
+
+    monkeypatch.setattr(db.boto3, "client", fake_client)
+    monkeypatch.setattr(db, "_make_sqlalchemy_engine_from_url", no_db_url)
+
+    with pytest.raises(_Refused):
+        db.warm_up()
+
+    cfg = configs[0]
+    assert cfg.connect_timeout == db._WARM_CONNECT_TIMEOUT
+    assert cfg.read_timeout == db._WARM_CONNECT_TIMEOUT
+    assert cfg.retries == {"max_attempts": 1}
+    assert db._session_factory is None  # lazy path retries with defaults
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    asgi_calls = []
+    fake_app = types.ModuleType("app")
+    fake_app.app = object()
+    fake_app.KNOWN_GENDERS = {"Male"}
+    fake_app._predict_eye = lambda *a: ("0", {})
+    fake_db = types.ModuleType("db")
+    fake_db.warm_up = lambda: None
+    fake_db.dispose_engine = lambda: None
+    fake_mangum = types.ModuleType("mangum")
+    fake_mangum.Mangum = lambda app: (lambda event, context: asgi_calls.append(event) or {"statusCode": 200})
+
+    monkeypatch.setitem(sys.modules, "app", fake_app)
+    monkeypatch.setitem(sys.modules, "db", fake_db)
+    monkeypatch.setitem(sys.modules, "mangum", fake_mangum)
+    monkeypatch.delitem(sys.modules, "handler", raising=False)
+    mod = importlib.import_module("handler")
+    mod.asgi_calls = asgi_calls
+    yield mod
+    sys.modules.pop("handler", None)
+
+
+API_EVENT = {"version": "2.0", "rawPath": "/health", "requestContext": {"http": {"method": "GET"}}}
+
+
+@pytest.mark.parametrize("event, expected", [
+    ({"source": "aws.events", "detail-type": "Scheduled Event"}, True),
+    ({"warmer": True}, True),
+    ({"warmer": "false"}, False),
+    (API_EVENT, False),
+    ("not-a-dict", False),
+])
+def test_is_keep_warm(handler, event, expected):
+    assert handler._is_keep_warm(event) is expected
+
+
+def test_keep_warm_event_skips_asgi(handler):
+    assert handler.handler({"source": "aws.events"}, None) == {"warm": True}
+    assert handler.asgi_calls == []
+
+
+def test_api_event_goes_through_asgi(handler):
+    assert handler.handler(API_EVENT, None) == {"statusCode": 200}
+    assert handler.asgi_calls == [API_EVENT]